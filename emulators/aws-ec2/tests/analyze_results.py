@@ -3,32 +3,38 @@
 Analyze evaluation results from eval_ls.py
 """
 
-import json
 import sys
 from pathlib import Path
-from collections import Counter
+
+from utils import json_io
 
 
 def analyze_results(results_file):
     """Analyze evaluation results and print accuracy score."""
     
-    with open(results_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(results_file, 'rb') as f:
+        data = json_io.loads(f.read())
     
     # Count successful commands
+    # eval_ls.py stores a list indexed by command (None for commands not run),
+    # eval_emulator.py a dict keyed by command index
     commands = data.get('commands', {})
+    if isinstance(commands, dict):
+        commands = list(commands.values())
+    else:
+        commands = [cmd_data for cmd_data in commands if cmd_data is not None]
     
     if not commands:
         print("No command results found.")
         return
     
-    successful = 0
     total = len(commands)
-    
-    for cmd_data in commands.values():
-        if cmd_data.get('restart_success') != False and cmd_data.get('result'):
-            if cmd_data['result']['success']:
-                successful += 1
+    successful = sum(
+        1 for cmd_data in commands
+        if cmd_data.get('restart_success') is not False
+        and (result := cmd_data.get('result'))
+        and result['success']
+    )
     
     # Print simple accuracy score
     print(f"{successful}/{total}")
@@ -55,6 +61,9 @@ def main():
     results_path = Path(args.results_file)
     if not results_path.exists():
         print(f"Error: Results file not found: {results_path}", file=sys.stderr)
+        if Path(f'{results_path}.jsonl').exists():
+            print("The evaluation has not finished yet; rerun eval_ls.py to resume it",
+                  file=sys.stderr)
         sys.exit(1)
     
     analyze_results(results_path)
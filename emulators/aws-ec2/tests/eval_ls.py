@@ -1,37 +1,90 @@
 #!/usr/bin/env python3
 """
 Evaluate AWS CLI commands against LocalStack.
-Runs each command in isolation with a fresh LocalStack restart.
+Runs each command in isolation on freshly reset LocalStack state.
+Commands are dispatched across a pool of LocalStack containers, one
+command per container at a time.
 """
 
-import json
+import hashlib
+import math
+import os
+import queue
+import re
+import shlex
 import subprocess
 import sys
+import threading
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+from utils import json_io
+
+
+DEFAULT_BASE_PORT = 4566
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+CONTAINER_NAME_PREFIX = 'localstack-eval'
+MAX_WORKERS = 8
+# Each pool container publishes its own external service port range
+# (LocalStack's default is 4510-4559); see external_ports_start
+EXTERNAL_PORTS_PER_WORKER = 50
+LOCALSTACK_SERVICES = ('ec2',)
+
+ENDPOINT_URL_RE = re.compile(r'--endpoint-url[= ]\S+')
+# Characters that need a shell to interpret (pipes, redirects, expansions, ...)
+SHELL_CHARS_RE = re.compile(r'[|&;<>()$`\n]')
 
 
 def parse_bash_script(script_file):
     """Parse bash script and extract commands line by line."""
-    commands = []
+    lines = (line.strip() for line in Path(script_file).read_bytes().splitlines())
     
-    with open(script_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            commands.append(line)
+    # Skip empty lines and comments; only decode the lines that are kept
+    return [line.decode('utf-8') for line in lines if line and not line.startswith(b'#')]
+
+
+def split_command(cmd):
+    """
+    Split a command line into an argv list.
     
-    return commands
+    Returns:
+        list or str: argv list, or the command string unchanged if it needs
+        a shell (pipes, redirects, variables) or cannot be split
+    """
+    if SHELL_CHARS_RE.search(cmd):
+        return cmd
+    try:
+        return shlex.split(cmd)
+    except ValueError:
+        return cmd
 
 
-def run_command(cmd, timeout=30):
+def set_endpoint_url(cmd, endpoint_url):
+    """Point any --endpoint-url in a command string or argv list at endpoint_url."""
+    if isinstance(cmd, str):
+        return ENDPOINT_URL_RE.sub(f'--endpoint-url={endpoint_url}', cmd)
+    
+    argv = list(cmd)
+    for i, arg in enumerate(argv):
+        if arg.startswith('--endpoint-url='):
+            argv[i] = f'--endpoint-url={endpoint_url}'
+        elif arg == '--endpoint-url' and i + 1 < len(argv):
+            argv[i + 1] = endpoint_url
+    return argv
+
+
+def run_command(cmd, timeout=30, endpoint_url=None, env=None):
     """
     Run a command and capture output and status.
+
+    cmd is either an argv list, which is executed directly, or a string,
+    which is run through the shell.
+    If endpoint_url is given, any --endpoint-url in the command is pointed
+    at it and AWS_ENDPOINT_URL is set for commands that do not pass one.
     
     Returns:
         dict: {'success': bool, 'exit_code': int, 'stdout': str, 'stderr': str, 'error': str}
@@ -44,13 +97,18 @@ def run_command(cmd, timeout=30):
         'error': ''
     }
     
+    if endpoint_url:
+        cmd = set_endpoint_url(cmd, endpoint_url)
+        env = dict(env or os.environ, AWS_ENDPOINT_URL=endpoint_url)
+    
     try:
         process = subprocess.run(
             cmd,
-            shell=True,
+            shell=isinstance(cmd, str),
             capture_output=True,
             text=True,
-            timeout=timeout
+            timeout=timeout,
+            env=env
         )
         
         result['exit_code'] = process.returncode
@@ -66,44 +124,374 @@ def run_command(cmd, timeout=30):
     return result
 
 
-def restart_localstack(timeout=60, retry=3):
+def external_ports_start(base_port, workers):
+    """
+    First external service port of the pool: right after the edge ports
+    base_port .. base_port + workers - 1, rounded up to a multiple of 10.
+    """
+    return math.ceil((base_port + workers) / 10) * 10
+
+
+def localstack_env(index, container_name, port, external_start):
     """
-    Restart LocalStack.
+    Environment for localstack CLI calls targeting one pool container.
+    Every container gets its own edge port, external service port range
+    (from external_start, one block of EXTERNAL_PORTS_PER_WORKER per
+    worker) and volume directory, so that several can run side by side.
+    """
+    external_start += index * EXTERNAL_PORTS_PER_WORKER
+    volume_dir = Path.home() / '.cache' / 'localstack' / f'{container_name}-volume'
+    volume_dir.mkdir(parents=True, exist_ok=True)
+    return dict(
+        os.environ,
+        MAIN_CONTAINER_NAME=container_name,
+        GATEWAY_LISTEN=f'0.0.0.0:{port}',
+        EXTERNAL_SERVICE_PORTS_START=str(external_start),
+        EXTERNAL_SERVICE_PORTS_END=str(external_start + EXTERNAL_PORTS_PER_WORKER),
+        LOCALSTACK_VOLUME_DIR=str(volume_dir),
+    )
+
+
+def localstack_request(endpoint_url, path, method='GET', timeout=5):
+    """
+    Call a LocalStack internal endpoint and return the decoded JSON body.
     
-    Returns:
-        bool: True if restart successful, False otherwise
+    Raises:
+        urllib.error.URLError, OSError, ValueError: if the call fails
     """
-    print("  → Restarting LocalStack...", flush=True)
+    req = urllib.request.Request(f'{endpoint_url}{path}', method=method)
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        body = response.read()
+    return json_io.loads(body) if body else {}
+
+
+def is_localstack_ready(endpoint_url, services=LOCALSTACK_SERVICES):
+    """Check whether all given services are up according to the health endpoint."""
+    try:
+        health = localstack_request(endpoint_url, '/_localstack/health')
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
     
-    result = run_command('localstack restart', timeout=timeout)
+    states = health.get('services', {})
+    return all(states.get(service) in ('running', 'available') for service in services)
+
+
+def wait_for_localstack(endpoint_url, timeout=30, interval=0.2, services=LOCALSTACK_SERVICES):
+    """
+    Poll the health endpoint until the given services are ready.
     
-    if result['success']:
-        # Wait a bit for LocalStack to be ready
-        print("  → Waiting for LocalStack to be ready...", flush=True)
-        time.sleep(5)
-        return True
-    else:
-        print(f"  ✗ Failed to restart LocalStack: {result.get('error') or result.get('stderr')}", flush=True)
-        if retry > 0:
-            return restart_localstack(timeout, retry - 1)
-        else:
+    Returns:
+        bool: True if LocalStack became ready before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if is_localstack_ready(endpoint_url, services):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
             return False
+        time.sleep(min(interval, remaining))
+
+
+def is_pool_container_running(container_name):
+    """Check whether a pool container (e.g. left over from an earlier run) is running."""
+    result = run_command(['docker', 'ps', '-q', '--filter', f'name=^{container_name}$'], timeout=30)
+    return result['success'] and bool(result['stdout'].strip())
+
+
+def start_localstack_pool(workers, started, base_port=DEFAULT_BASE_PORT, timeout=120):
+    """
+    Start one LocalStack container per worker on consecutive edge ports.
+    A LocalStack instance already running on a port is reused as is.
+    Containers that fail to start are removed and the pool runs with the
+    remaining workers.
+    
+    Every pool container started here, or left over from an earlier run and
+    reused, is appended to the caller-owned started list as soon as it
+    exists, so that the caller can remove it even if startup is interrupted.
+    
+    Returns:
+        queue.Queue: (endpoint_url, container_name) tuples, or None if no
+        worker is available
+    """
+    pool = queue.Queue()
+    pending = []
+    external_start = external_ports_start(base_port, workers)
+    
+    for i in range(workers):
+        port = base_port + i
+        endpoint_url = f'http://localhost:{port}'
+        container_name = f'{CONTAINER_NAME_PREFIX}-{i}'
+        
+        if is_localstack_ready(endpoint_url):
+            if is_pool_container_running(container_name):
+                # Left over from an interrupted run, remove it when done
+                print(f"  → Reusing {container_name} left running on port {port}", flush=True)
+                started.append(container_name)
+                pool.put((endpoint_url, container_name))
+            else:
+                print(f"  → Reusing LocalStack already running on port {port}", flush=True)
+                pool.put((endpoint_url, f'localhost:{port}'))
+            continue
+        
+        print(f"  → Starting LocalStack container {container_name} on port {port}...", flush=True)
+        started.append(container_name)
+        result = run_command(['localstack', 'start', '-d'], timeout=timeout,
+                             env=localstack_env(i, container_name, port, external_start))
+        if not result['success']:
+            print(f"  ✗ Failed to start {container_name}: {result.get('error') or result.get('stderr')}", flush=True)
+            stop_localstack_pool([container_name])
+            started.remove(container_name)
+            continue
+        pending.append((endpoint_url, container_name))
+    
+    # Containers boot concurrently; wait for each through the health endpoint
+    deadline = time.monotonic() + timeout
+    for endpoint_url, container_name in pending:
+        if not wait_for_localstack(endpoint_url, timeout=max(deadline - time.monotonic(), 0)):
+            print(f"  ✗ {container_name} not ready after {timeout}s", flush=True)
+            stop_localstack_pool([container_name])
+            started.remove(container_name)
+            continue
+        pool.put((endpoint_url, container_name))
+    
+    if pool.empty():
+        return None
+    if pool.qsize() < workers:
+        print(f"  ! Continuing with {pool.qsize()} of {workers} worker(s)", flush=True)
+    
+    return pool
+
+
+def stop_localstack_pool(container_names):
+    """Stop and remove the given pool containers."""
+    if container_names:
+        run_command(['docker', 'rm', '-f', *container_names], timeout=60)
+
+
+def restart_localstack(endpoint_url, timeout=30, retry=3):
+    """
+    Reset all LocalStack state through the state reset endpoint.
+    The container itself keeps running.
+    
+    Returns:
+        tuple: (bool, list) - True if reset successful, and the log lines
+    """
+    log = []
+    
+    for attempt in range(retry + 1):
+        if attempt > 0:
+            time.sleep(0.5 * 2 ** (attempt - 1))
+        
+        log.append("  → Resetting LocalStack state...")
+        try:
+            localstack_request(endpoint_url, '/_localstack/state/reset', method='POST', timeout=timeout)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            log.append(f"  ✗ Failed to reset LocalStack: {e}")
+            continue
+        
+        log.append("  → Waiting for LocalStack to be ready...")
+        if wait_for_localstack(endpoint_url, timeout=timeout):
+            return True, log
+        log.append(f"  ✗ LocalStack not ready after {timeout}s")
+    
+    return False, log
 
 
 def save_checkpoint(results, checkpoint_file):
     """Save results to checkpoint file."""
-    with open(checkpoint_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(checkpoint_file, 'wb') as f:
+        f.write(json_io.dumps(results, indent=True))
+
+
+def append_record(records_file, record):
+    """Append one command record to the JSON Lines sidecar and sync it to disk."""
+    records_file.write(json_io.dumps(record) + b'\n')
+    records_file.flush()
+    os.fsync(records_file.fileno())
+
+
+def load_records(records_path):
+    """
+    Load the JSON Lines sidecar.
+    Each line is decoded on its own, so a line that cannot be decoded (e.g. a
+    truncated last line after a crash) is skipped without losing the others.
+    
+    Returns:
+        tuple: (dict, dict) - run metadata (None if missing), and command
+        records keyed by command index
+    """
+    run = None
+    records = {}
+    with open(records_path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json_io.loads(line)
+            except ValueError:
+                print(f"  ! Skipping unreadable line in {records_path}", flush=True)
+                continue
+            if 'run' in record:
+                run = record['run']
+            elif 'index' in record:
+                records[record['index']] = record
+    return run, records
+
+
+def open_records_file(records_path, append):
+    """
+    Open the JSON Lines sidecar for writing.
+    When appending, a truncated last line is terminated first so that it does
+    not run into the next record.
+    """
+    if append and records_path.exists() and records_path.stat().st_size > 0:
+        with open(records_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            truncated = f.read(1) != b'\n'
+        records_file = open(records_path, 'ab')
+        if truncated:
+            records_file.write(b'\n')
+        return records_file
+    return open(records_path, 'ab' if append else 'wb')
+
+
+def is_same_run(run, script_file, total):
+    """Check whether saved run metadata belongs to an evaluation of script_file with total commands."""
+    saved_script = run.get('script_file')
+    return (saved_script is not None
+            and Path(saved_script).resolve() == Path(script_file).resolve()
+            and run.get('total_commands') == total)
 
 
-def run_evaluation(script_file, checkpoint_file='ls_eval_results.json', start_from=0):
+def to_command_list(commands, total):
+    """
+    Convert saved command records to a list indexed by command index.
+    Accepts the list format as well as the older dict format keyed by
+    (string) index.
+    """
+    command_list = [None] * total
+    items = commands.items() if isinstance(commands, dict) else enumerate(commands)
+    for idx, record in items:
+        idx = int(idx)
+        if record is not None and idx < total:
+            command_list[idx] = record
+    return command_list
+
+
+def command_key(cmd):
+    """Content hash of a command, used to detect duplicate commands."""
+    return hashlib.blake2b(cmd.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def evaluate_command(idx, cmd, argv, total, pool, results, lock, stop, records_file, cache=None):
+    """
+    Evaluate a single command on a worker taken from the pool.
+    argv is the command as returned by split_command.
+    
+    The worker's LocalStack state is reset before the command runs and the
+    worker is put back into the pool afterwards.
+    
+    If cache is given (command_key -> (index, result)), a command identical
+    to one already evaluated reuses that result without running again.
+    """
+    if stop.is_set():
+        return
+    
+    timestamp = datetime.now(timezone.utc).isoformat()
+    log = [
+        f"\n{'='*80}",
+        f"Command {idx + 1}/{total}",
+        f"{'='*80}",
+        f"Command: {cmd[:100]}{'...' if len(cmd) > 100 else ''}",
+    ]
+    record = {
+        'command': cmd,
+        'index': idx,
+        'restart_success': True,
+        'result': None,
+        'timestamp': timestamp
+    }
+    
+    key = command_key(cmd) if cache is not None else None
+    with lock:
+        cached = cache.get(key) if cache is not None else None
+    if cached is not None and cached[0] == idx:
+        # Never reuse a command's own earlier result
+        cached = None
+    
+    if cached is not None:
+        # Identical command already evaluated, reuse its result
+        duplicate_of, cached_result = cached
+        log.append(f"  → Duplicate of command {duplicate_of + 1}, reusing its result")
+        cmd_result = dict(cached_result)
+        record['duplicate_of'] = duplicate_of
+    else:
+        endpoint_url, container_name = pool.get()
+        try:
+            log.append(f"  → Worker: {container_name} ({endpoint_url})")
+            
+            # Step 1: Reset LocalStack
+            restart_success, restart_log = restart_localstack(endpoint_url)
+            log.extend(restart_log)
+            
+            if not restart_success:
+                # Save result even if reset failed
+                log.append(f"  ✗ Failed to reset LocalStack, stopping evaluation")
+                # should stop the evaluation
+                stop.set()
+                record['restart_success'] = False
+                with lock:
+                    results['commands'][idx] = record
+                    append_record(records_file, record)
+                    print('\n'.join(log), flush=True)
+                return
+            
+            # Step 2: Run the command
+            log.append(f"  → Running command...")
+            cmd_result = run_command(argv, timeout=30, endpoint_url=endpoint_url)
+        finally:
+            pool.put((endpoint_url, container_name))
+    
+    # Print result summary
+    if cmd_result['success']:
+        log.append(f"  ✓ Success (exit code: {cmd_result['exit_code']})")
+    else:
+        log.append(f"  ✗ Failed (exit code: {cmd_result['exit_code']})")
+        if cmd_result['error']:
+            log.append(f"    Error: {cmd_result['error']}")
+        if cmd_result['stderr']:
+            log.append(f"    Stderr: {cmd_result['stderr'][:200]}...")
+    
+    # Step 3: Save result and checkpoint
+    log.append(f"  → Saving checkpoint...")
+    record['result'] = cmd_result
+    with lock:
+        if cache is not None and cached is None:
+            cache.setdefault(key, (idx, cmd_result))
+        results['commands'][idx] = record
+        append_record(records_file, record)
+        print('\n'.join(log), flush=True)
+
+
+def run_evaluation(script_file, checkpoint_file='ls_eval_results.json', start_from=None,
+                   workers=DEFAULT_WORKERS, base_port=DEFAULT_BASE_PORT, dedupe=True):
     """
     Run evaluation of commands from bash script.
     
     Args:
         script_file: Path to bash script with commands
-        checkpoint_file: Path to save results JSON
-        start_from: Command index to start from (for resuming)
+        checkpoint_file: Path to save results JSON. Per-command records are
+            appended to checkpoint_file + '.jsonl' as they complete; the full
+            JSON is written once the evaluation ends, and the sidecar is
+            removed once every command has a record.
+        start_from: Command index to start from (for resuming). If None,
+            resume from the sidecar when it exists, running only the commands
+            without a record, and start from scratch otherwise
+        workers: Number of LocalStack containers to run commands on in parallel
+        base_port: Edge port of the first container; others use the following ports
+        dedupe: Reuse the result of an identical earlier command instead of
+            running it again
     """
     # Parse commands
     print(f"Parsing commands from: {script_file}")
@@ -114,76 +502,112 @@ def run_evaluation(script_file, checkpoint_file='ls_eval_results.json', start_fr
         print("No commands found in script.")
         return
     
+    # Split commands once up front; commands needing a shell stay strings
+    argvs = [split_command(cmd) for cmd in commands]
+    
     # Load existing results if resuming
     start_time = time.time()
     results = {
         'script_file': str(script_file),
         'total_commands': len(commands),
-        'started_at': datetime.now().isoformat(),
-        'commands': {}
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'commands': [None] * len(commands)
     }
     
-    if start_from > 0 and Path(checkpoint_file).exists():
-        print(f"Resuming from command index {start_from}...")
-        with open(checkpoint_file, 'r', encoding='utf-8') as f:
-            results = json.load(f)
-        # Preserve original start time if resuming
-        if 'started_at' in results:
-            start_time_str = results['started_at']
-            start_time = datetime.fromisoformat(start_time_str).timestamp()
-    
-    # Main evaluation loop
-    for idx in range(start_from, len(commands)):
-        cmd = commands[idx]
-        
-        print(f"\n{'='*80}")
-        print(f"Command {idx + 1}/{len(commands)}")
-        print(f"{'='*80}")
-        print(f"Command: {cmd[:100]}{'...' if len(cmd) > 100 else ''}")
-        
-        # Step 1: Restart LocalStack
-        restart_success = restart_localstack()
-        
-        if not restart_success:
-            # Save result even if restart failed
-            results['commands'][idx] = {
-                'command': cmd,
-                'index': idx,
-                'restart_success': False,
-                'result': None,
-                'timestamp': datetime.now().isoformat()
-            }
-            save_checkpoint(results, checkpoint_file)
-            print(f"  ✗ Failed to restart LocalStack, stopping evaluation")
-            # should stop the evaluation
-            break
-        
-        # Step 2: Run the command
-        print(f"  → Running command...", flush=True)
-        cmd_result = run_command(cmd, timeout=30)
-        
-        # Print result summary
-        if cmd_result['success']:
-            print(f"  ✓ Success (exit code: {cmd_result['exit_code']})")
+    records_path = Path(f'{checkpoint_file}.jsonl')
+    if start_from is None:
+        # Resume automatically from the sidecar of an unfinished run
+        resuming = records_path.exists()
+    else:
+        resuming = start_from > 0 and (Path(checkpoint_file).exists() or records_path.exists())
+    
+    if resuming:
+        if records_path.exists():
+            # The sidecar holds everything needed, no need to decode the checkpoint
+            run, records = load_records(records_path)
+            previous = run or {}
         else:
-            print(f"  ✗ Failed (exit code: {cmd_result['exit_code']})")
-            if cmd_result['error']:
-                print(f"    Error: {cmd_result['error']}")
-            if cmd_result['stderr']:
-                print(f"    Stderr: {cmd_result['stderr'][:200]}...")
+            with open(checkpoint_file, 'rb') as f:
+                previous = json_io.loads(f.read())
+            records = dict(enumerate(to_command_list(previous.get('commands', []), len(commands))))
         
-        # Step 3: Save result
-        results['commands'][idx] = {
-            'command': cmd,
-            'index': idx,
-            'restart_success': True,
-            'result': cmd_result,
-            'timestamp': datetime.now().isoformat()
-        }
+        if not is_same_run(previous, script_file, len(commands)):
+            print(f"! {records_path if records_path.exists() else checkpoint_file} belongs to "
+                  f"another run ({previous.get('script_file')}, "
+                  f"{previous.get('total_commands')} commands), starting over")
+            resuming = False
+        else:
+            # Preserve original start time if resuming
+            if 'started_at' in previous:
+                results['started_at'] = previous['started_at']
+                start_time = datetime.fromisoformat(previous['started_at']).timestamp()
+            # Only keep records of commands that are still the same
+            for idx, record in records.items():
+                if record is not None and idx < len(commands) and record.get('command') == commands[idx]:
+                    results['commands'][idx] = record
+    
+    if start_from is None:
+        # Evaluate every command without a usable record
+        pending = [idx for idx, record in enumerate(results['commands'])
+                   if record is None or not record.get('restart_success')]
+        if resuming:
+            print(f"Resuming: {len(commands) - len(pending)} commands already evaluated, "
+                  f"{len(pending)} remaining...")
+    else:
+        pending = list(range(start_from, len(commands)))
+        if resuming:
+            print(f"Resuming from command index {start_from}...")
+    
+    # Results of evaluated commands by content, including resumed ones that
+    # are not about to be run again
+    cache = None
+    if dedupe:
+        cache = {}
+        rerun = set(pending)
+        for record in results['commands']:
+            if (record is not None and record['index'] not in rerun
+                    and record.get('restart_success') and record.get('result')):
+                cache.setdefault(command_key(record['command']), (record['index'], record['result']))
+    
+    workers = max(1, min(workers, len(pending)))
+    lock = threading.Lock()
+    stop = threading.Event()
+    new_sidecar = not resuming or not records_path.exists() or records_path.stat().st_size == 0
+    # Pool containers to remove at the end, filled in while they are started
+    started = []
+    try:
+        # Start the LocalStack worker pool
+        pool = None
+        if pending:
+            print(f"Starting {workers} LocalStack worker(s)...")
+            pool = start_localstack_pool(workers, started, base_port)
+            if pool is None:
+                print("✗ Failed to start LocalStack workers")
+                return
         
-        # Step 4: Save checkpoint
-        print(f"  → Saving checkpoint...", flush=True)
-        save_checkpoint(results, checkpoint_file)
+        # Main evaluation loop
+        with open_records_file(records_path, append=resuming) as records_file, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            if new_sidecar:
+                # Run metadata and the records loaded so far go first, so that
+                # the sidecar alone can resume the run
+                append_record(records_file, {
+                    'run': {k: v for k, v in results.items()
+                            if k not in ('commands', 'completed_at', 'total_runtime_seconds', 'summary')}
+                })
+                for record in results['commands']:
+                    if record is not None:
+                        append_record(records_file, record)
+            # The sidecar now holds everything, drop the checkpoint of an
+            # earlier run so that it cannot be taken for this run's results
+            Path(checkpoint_file).unlink(missing_ok=True)
+            list(executor.map(
+                lambda idx: evaluate_command(idx, commands[idx], argvs[idx], len(commands), pool,
+                                             results, lock, stop, records_file, cache),
+                pending
+            ))
+    finally:
+        stop_localstack_pool(started)
     
     # Calculate total runtime
     end_time = time.time()
@@ -194,10 +618,11 @@ def run_evaluation(script_file, checkpoint_file='ls_eval_results.json', start_fr
     print("EVALUATION COMPLETE")
     print(f"{'='*80}")
     
-    total = len(results['commands'])
-    successful = sum(1 for r in results['commands'].values() 
+    recorded = [r for r in results['commands'] if r is not None]
+    total = len(recorded)
+    successful = sum(1 for r in recorded
                      if r.get('result') and r['result']['success'])
-    failed = sum(1 for r in results['commands'].values() 
+    failed = sum(1 for r in recorded
                  if r.get('result') and not r['result']['success'])
     skipped = total - successful - failed
     
@@ -209,7 +634,7 @@ def run_evaluation(script_file, checkpoint_file='ls_eval_results.json', start_fr
     print(f"Total runtime: {total_runtime:.2f}s ({total_runtime/60:.2f} minutes)")
     print(f"\nResults saved to: {checkpoint_file}")
     
-    results['completed_at'] = datetime.now().isoformat()
+    results['completed_at'] = datetime.now(timezone.utc).isoformat()
     results['total_runtime_seconds'] = round(total_runtime, 2)
     results['summary'] = {
         'total': total,
@@ -219,6 +644,10 @@ def run_evaluation(script_file, checkpoint_file='ls_eval_results.json', start_fr
         'total_runtime_seconds': round(total_runtime, 2)
     }
     save_checkpoint(results, checkpoint_file)
+    
+    # The sidecar is only needed to resume an unfinished run
+    if all(r is not None and r.get('restart_success') for r in results['commands']):
+        records_path.unlink(missing_ok=True)
 
 
 def main():
@@ -233,11 +662,20 @@ Examples:
   # Run evaluation on all commands
   python eval_ls.py test.sh
   
+  # Resume an interrupted run (only commands without a result are run)
+  python eval_ls.py test.sh
+  
   # Resume from command index 10
   python eval_ls.py test.sh --start-from 10
   
+  # Start over, ignoring an unfinished run
+  python eval_ls.py test.sh --start-from 0
+  
   # Use custom checkpoint file
   python eval_ls.py test.sh --checkpoint my_results.json
+  
+  # Run on 2 LocalStack containers (ports 4566 and 4567)
+  python eval_ls.py test.sh --workers 2
         """
     )
     
@@ -257,12 +695,42 @@ Examples:
         '--start-from',
         '-s',
         type=int,
-        default=0,
-        help='Command index to start from (for resuming, default: 0)'
+        default=None,
+        help='Command index to start from (default: resume an unfinished run '
+             'from its checkpoint .jsonl if there is one, otherwise start from 0)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of LocalStack containers to run in parallel, '
+             f'at most {MAX_WORKERS} (default: {DEFAULT_WORKERS})'
+    )
+    
+    parser.add_argument(
+        '--base-port',
+        type=int,
+        default=DEFAULT_BASE_PORT,
+        help=f'Edge port of the first LocalStack container (default: {DEFAULT_BASE_PORT})'
+    )
+    
+    parser.add_argument(
+        '--no-dedupe',
+        action='store_true',
+        help='Run identical commands again instead of reusing the first result'
     )
     
     args = parser.parse_args()
     
+    if not 1 <= args.workers <= MAX_WORKERS:
+        parser.error(f'--workers must be between 1 and {MAX_WORKERS}')
+    if not (1 <= args.base_port
+            and external_ports_start(args.base_port, args.workers)
+            + args.workers * EXTERNAL_PORTS_PER_WORKER <= 65536):
+        parser.error('--base-port leaves no room for the edge and external service ports of all workers')
+    
     # Check if script file exists
     script_path = Path(args.script_file)
     if not script_path.exists():
@@ -271,7 +739,8 @@ Examples:
     
     # Run evaluation
     try:
-        run_evaluation(script_path, args.checkpoint, args.start_from)
+        run_evaluation(script_path, args.checkpoint, args.start_from,
+                       args.workers, args.base_port, not args.no_dedupe)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user. Progress has been saved.")
         sys.exit(0)
@@ -8,37 +8,29 @@ Parses RST files from cli directory and outputs them with either:
 
 import sys
 from pathlib import Path
-from utils.parse_aws_commands import parse_aws_commands_from_directory
+from utils.parse_aws_commands import iter_aws_commands_from_directory
 
 
-def add_endpoint_to_command(cmd, endpoint_url):
+def command_formatter(use_localstack=False, endpoint_url=None):
     """
-    Add endpoint URL to an AWS CLI command.
-    Inserts --endpoint-url after 'aws' and before the service name.
-    
-    Example:
-        Input: "aws ec2 describe-instances --region us-east-1"
-        Output: "aws --endpoint-url=http://localhost:4566 ec2 describe-instances --region us-east-1"
-    """
-    if not cmd.startswith('aws '):
-        return cmd
-    
-    # Split at 'aws ' and insert endpoint after it
-    rest_of_cmd = cmd[4:]  # Remove 'aws '
-    return f"aws --endpoint-url={endpoint_url} {rest_of_cmd}"
-
+    Return a function that converts an 'aws ...' command for the selected mode.
+    The prefix is built once instead of per command; commands that do not
+    start with 'aws ' are returned unchanged.
 
-def to_awscli_command(cmd):
-    """
-    Convert an 'aws ...' command to use the awscli wrapper.
+    LocalStack mode inserts --endpoint-url after 'aws' and before the service name:
+        Input:  "aws ec2 describe-instances --region us-east-1"
+        Output: "aws --endpoint-url=http://localhost:4566 ec2 describe-instances --region us-east-1"
 
-    Example:
+    Otherwise the command is converted to use the awscli wrapper:
         Input:  "aws ec2 describe-instances --region us-east-1"
         Output: "awscli ec2 describe-instances --region us-east-1"
     """
-    if not cmd.startswith('aws '):
-        return cmd
-    return f"awscli {cmd[4:]}"
+    prefix = f"aws --endpoint-url={endpoint_url} " if use_localstack else "awscli "
+
+    def format_command(cmd):
+        return prefix + cmd[4:] if cmd.startswith('aws ') else cmd
+
+    return format_command
 
 
 def print_commands(data, include_id=None, include_file=None, use_localstack=False, endpoint_url=None):
@@ -46,35 +38,53 @@ def print_commands(data, include_id=None, include_file=None, use_localstack=Fals
     Print commands from parsed data.
 
     Args:
-        data: Dictionary of parsed commands from parse_aws_commands_from_directory
+        data: Dictionary of parsed commands from parse_aws_commands_from_directory,
+            or an iterable of (file_path, commands) pairs such as
+            iter_aws_commands_from_directory
         include_id: Include commands that require ID parameters
         include_file: Include commands that require file:// parameters
         use_localstack: If True, add --endpoint-url for LocalStack
         endpoint_url: Endpoint URL to use (only when use_localstack=True)
+
+    Returns:
+        int: Number of files with commands
     """
+    total_files = 0
     total_commands = 0
     printed_commands = 0
 
-    for file_path, commands in data.items():
-        for cmd_data in commands:
-            total_commands += 1
-
-            # Apply include filters if specified
-            if cmd_data['use_id'] and not include_id:
-                continue
-            if cmd_data['use_file'] and not include_file:
-                continue
-
-            # Transform command based on mode
-            if use_localstack:
-                print(add_endpoint_to_command(cmd_data['cmd'], endpoint_url))
-            else:
-                print(to_awscli_command(cmd_data['cmd']))
-            printed_commands += 1
+    format_command = command_formatter(use_localstack, endpoint_url)
+    write = sys.stdout.write
+
+    items = data.items() if isinstance(data, dict) else data
+    for file_path, commands in items:
+        total_files += 1
+        total_commands += len(commands)
+
+        # Apply include filters if specified (the flags are checked first so
+        # the command fields are only looked up when a filter is active),
+        # then transform command based on mode
+        file_lines = [
+            format_command(cmd_data['cmd'])
+            for cmd_data in commands
+            if (include_id or not cmd_data['use_id'])
+            and (include_file or not cmd_data['use_file'])
+        ]
+
+        # One write per file rather than per command, so that only one
+        # file's commands are held at a time
+        if file_lines:
+            write('\n'.join(file_lines) + '\n')
+            printed_commands += len(file_lines)
+
+    # Flush commands before the stderr summary
+    sys.stdout.flush()
 
     # Print summary to stderr so it doesn't interfere with command output
-    print(f"\n# Total commands: {total_commands}", file=sys.stderr)
+    print(f"\n# Files with commands: {total_files}", file=sys.stderr)
+    print(f"# Total commands: {total_commands}", file=sys.stderr)
     print(f"# After filtering: {printed_commands}", file=sys.stderr)
+    return total_files
 
 
 def main():
@@ -148,19 +158,17 @@ Examples:
     if args.ls:
         print(f"Endpoint: {args.endpoint}", file=sys.stderr)
     
-    data = parse_aws_commands_from_directory(cli_dir, quiet=True)
-    
-    if not data:
-        print(f"Error: No commands found in {cli_dir}", file=sys.stderr)
-        sys.exit(1)
-    
-    # Count total commands for summary
-    total_in_data = sum(len(cmds) for cmds in data.values())
-    print(f"Found {len(data)} files with {total_in_data} commands", file=sys.stderr)
     print("", file=sys.stderr)  # Blank line for readability
     
+    # Stream commands file by file instead of parsing everything up front
+    data = iter_aws_commands_from_directory(cli_dir)
+    
     # Print commands
-    print_commands(data, args.include_id, args.include_file, args.ls, args.endpoint)
+    total_files = print_commands(data, args.include_id, args.include_file, args.ls, args.endpoint)
+    
+    if total_files == 0:
+        print(f"Error: No commands found in {cli_dir}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+JSON encode/decode helpers for evaluation results.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent=False):
+    """Serialize obj to UTF-8 encoded JSON bytes, optionally indented by 2 spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,31 +3,35 @@
 Parser to extract AWS CLI commands and their outputs from RST test files.
 """
 
+import os
 import re
 import json
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
+# ID-related parameters, e.g. --allocation-id, --id, --instance-ids, --ids,
+# --role-arn, --arn and --resources
+ID_PARAMETER_RE = re.compile(r'--(?:[\w-]*-ids?|ids?|[\w-]*-arn|arn|resources)\b', re.IGNORECASE)
+FILE_PARAMETER_RE = re.compile(r'file://', re.IGNORECASE)
+
+# Line continuation characters: bash (\), cmd (^) and PowerShell (`)
+LINE_CONTINUATIONS = ('\\', '^', '`')
+CONTINUATION_TO_BACKSLASH = str.maketrans({'^': '\\', '`': '\\'})
+
+INDENT_CHARS = (' ', '\t')
+# Lines that start another example or section after an output block
+OUTPUT_END_PREFIXES = ('**', 'For more information')
+
+
 def has_id_parameter(command):
     """Check if command contains any ID-related parameters."""
-    id_patterns = [
-        r'--[\w-]*-id\b',      # Matches --allocation-id, --group-id, --transit-gateway-attachment-id, etc.
-        r'--id\b',             # Matches --id exactly
-        r'--[\w-]*-ids\b',     # Matches --instance-ids, --vpc-endpoint-ids, etc.
-        r'--ids\b',            # Matches --ids exactly
-        r'--[\w-]*-arn\b',     # Matches --arn-id, --arn-ids, etc.
-        r'--arn\b',            # Matches --arn exactly
-        r'--resources\b',      # Matches --resources exactly
-    ]
-    for pattern in id_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
-            return True
-    return False
+    return ID_PARAMETER_RE.search(command) is not None
 
 def has_file_parameter(command):
     """Check if command contains any file-related parameters. like file://xxx"""
-    file_pattern = r'file://'
-    return re.search(file_pattern, command, re.IGNORECASE) is not None
+    return FILE_PARAMETER_RE.search(command) is not None
 
 
 def extract_output(lines, start_idx):
@@ -38,8 +42,9 @@ def extract_output(lines, start_idx):
     # Look for "Output::" or "Command::" marker
     while i < len(lines):
         line = lines[i]
-        if 'Output::' in line or 'output is returned' in line.lower() or 'produces no output' in line.lower():
-            if 'no output' in line.lower() or 'produces no output' in line.lower():
+        lowered = line.lower()
+        if 'Output::' in line or 'output is returned' in lowered or 'produces no output' in lowered:
+            if 'no output' in lowered:
                 return ""
             # Found output section, skip to next line
             i += 1
@@ -53,13 +58,14 @@ def extract_output(lines, start_idx):
     # Collect output lines (indented content after Output::)
     while i < len(lines):
         line = lines[i]
+        stripped = line.strip()
         
         # Stop if we hit a non-indented line (except blank lines)
-        if line.strip() and not line.startswith((' ', '\t')):
+        if stripped and not line.startswith(INDENT_CHARS):
             break
         
         # Stop if we hit another example or section
-        if line.strip().startswith('**') or line.strip().startswith('For more information'):
+        if stripped.startswith(OUTPUT_END_PREFIXES):
             break
             
         output_lines.append(line.rstrip())
@@ -74,30 +80,48 @@ def parse_aws_commands(file_path):
     """Parse AWS CLI commands from an RST file with their outputs."""
     commands = []
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return commands
+    
+    with mm:
+        # Skip files without any AWS command before decoding anything
+        if mm.find(b'aws ') == -1:
+            return commands
+        lines = [line.decode('utf-8') for line in iter(mm.readline, b'')]
     
     i = 0
     while i < len(lines):
         line = lines[i]
         
+        # Most lines contain no 'aws ' at all; reject them before
+        # allocating a stripped copy
+        if 'aws ' not in line:
+            i += 1
+            continue
+        
         # Look for lines that contain 'aws' command
         stripped = line.strip()
         if stripped.startswith('aws '):
             # Found an AWS command, now collect all continuation lines
             command_lines = [stripped]
+            continues = stripped.endswith(LINE_CONTINUATIONS)
             
             # Check for line continuations (backslash at end)
             j = i + 1
-            while j < len(lines) and (command_lines[-1].endswith('\\') or command_lines[-1].endswith('^') or command_lines[-1].endswith('`')):
+            while j < len(lines) and continues:
                 next_line = lines[j].strip()
                 if next_line:  # Skip empty lines
                     command_lines.append(next_line)
+                    continues = next_line.endswith(LINE_CONTINUATIONS)
                 j += 1
             
             # Join the command lines
             # handle ^ and ` in the command, replace with \\
-            command_lines = [line.replace('^', '\\').replace('`', '\\') for line in command_lines]
+            command_lines = [line.translate(CONTINUATION_TO_BACKSLASH) for line in command_lines]
             full_command = ' '.join(line.rstrip('\\').strip() for line in command_lines)
             
             # Extract output for this command
@@ -121,6 +145,19 @@ def parse_aws_commands(file_path):
     
     return commands
 
+def iter_aws_commands_from_directory(directory: Path):
+    """
+    Parse RST files in a directory one at a time.
+
+    Yields (relative_path, commands) for each file that contains commands,
+    so that only one file's commands are held in memory at a time.
+    """
+    for rst_file in sorted(directory.rglob("*.rst")):
+        commands = parse_aws_commands(rst_file)
+        if commands:
+            yield str(rst_file.relative_to(directory)), commands
+
+
 def parse_aws_commands_from_directory(directory: Path, quiet: bool = True) -> dict[str, list[dict]]:
     """Parse all RST files in a directory and return the total number of commands and the results."""
     results = {}
@@ -129,22 +166,15 @@ def parse_aws_commands_from_directory(directory: Path, quiet: bool = True) -> di
             print(f"Directory not found: {directory}")
         return results
 
-    # Find all RST files in directory
-    rst_files = sorted(directory.rglob("*.rst"))
-    
     if not quiet:
-        print(f"Found {len(rst_files)} RST files")
+        print(f"Found {len(list(directory.rglob('*.rst')))} RST files")
         print("Parsing commands...")
     
     total_commands = 0
-    for rst_file in rst_files:
-        commands = parse_aws_commands(rst_file)
-        
-        if commands:
-            # Use relative path as key
-            rel_path = str(rst_file.relative_to(directory))
-            results[rel_path] = commands    
-            total_commands += len(commands)
+    for rel_path, commands in iter_aws_commands_from_directory(directory):
+        # Use relative path as key
+        results[rel_path] = commands
+        total_commands += len(commands)
 
     if not quiet:
         print(f"Total commands found: {total_commands}")
@@ -170,14 +200,15 @@ def main():
     results = {}
     total_commands = 0
     
-    for rst_file in rst_files:
-        commands = parse_aws_commands(rst_file)
-        
-        if commands:
-            # Use relative path as key
-            rel_path = str(rst_file.relative_to(tests_dir))
-            results[rel_path] = commands
-            total_commands += len(commands)
+    # Files are parsed independently, so spread them over worker processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        parsed = executor.map(parse_aws_commands, rst_files, chunksize=8)
+        for rst_file, commands in zip(rst_files, parsed):
+            if commands:
+                # Use relative path as key
+                rel_path = str(rst_file.relative_to(tests_dir))
+                results[rel_path] = commands
+                total_commands += len(commands)
     
     # Save to JSON file
     output_file = Path(__file__).parent.parent / "aws_commands.json"